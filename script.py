@@ -1,101 +1,445 @@
+import hashlib
 import json
+import pickle
 import re
 import os
+import string
+import csv
 import glob
-import pandas as pd
+import numpy as np
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import re2  # google-re2: guaranteed linear-time (DFA) matching
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick  # pyahocorasick: one-pass multi-literal matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    from numba import njit  # JIT-compiled numeric kernels
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # C JSON parser, several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan  # Intel Hyperscan: SIMD multi-pattern scanning
+except ImportError:
+    hyperscan = None
+
+
+_PROFANITY_LIST = frozenset({
+    "damn", "hell", "shit", "fuck", "ass", "bitch", "crap", "piss",
+    "dick", "bastard", "asshole", "bullshit", "cunt", "goddamn"
+})
+
+# The profanity list is plain ASCII words, so splitting on whitespace
+# after mapping punctuation to spaces tokenizes the same way as \b\w+\b
+# without a regex scan per utterance. Underscore stays: \w treats it as
+# a word character, so 'dumb_ass' is one token, not two.
+_PUNCT_CHARS = string.punctuation.replace("_", "")
+_PUNCT_TABLE = str.maketrans(_PUNCT_CHARS, " " * len(_PUNCT_CHARS))
+
+_SENSITIVE_SOURCES = {
+    "SSN": r'\b\d{3}[-]?\d{2}[-]?\d{4}\b',
+    "DOB": r'\b(0?[1-9]|1[0-2])[\/\-](0?[1-9]|[12][0-9]|3[01])[\/\-](19|20)?\d{2}\b',
+    "Account": r'\baccount\s?(?:number|#|no)?\s?[:#]?\s?\d{4,}\b',
+    "Balance": r'\b(?:balance|amount|owe|debt).{0,20}\$?\s?\d+(?:\.\d{2})?\b',
+    "Credit Card": r'\b(?:\d{4}[ -]?){3}\d{4}\b',
+    "Phone": r'\b(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b'
+}
+
+# Compile the PII patterns with RE2 when it is available so every search
+# runs in linear time; stdlib re stays as the fallback.
+_PATTERN_ENGINE = re2 if re2 is not None else re
+
+
+def _compile(engine, source):
+    """Compile a pattern, forcing ASCII character classes on stdlib re.
+
+    The patterns only ever match ASCII (digits, dollar signs, keywords),
+    and re.ASCII turns \\d/\\w/\\b into byte-range checks instead of
+    Unicode table probes. RE2's Perl classes are ASCII-only already and
+    it does not take stdlib flags."""
+    if engine is re:
+        return re.compile(source, re.ASCII)
+    return engine.compile(source)
+
+
+_SENSITIVE_PATTERNS = {
+    label: _compile(_PATTERN_ENGINE, source) for label, source in _SENSITIVE_SOURCES.items()
+}
+
+# Addresses are matched in two phases instead of one anchored regex
+# (the old pattern's unbounded street-word repetition was a backtracking
+# trap): a cheap anchor finds candidate offsets, then a validator with a
+# bounded {1,6} street-word quantifier runs against a fixed-size window
+# from each candidate.
+_ADDR_ANCHOR = _compile(_PATTERN_ENGINE, r'\b\d+\s+[A-Za-z]')
+_ADDR_VALIDATOR = _compile(
+    _PATTERN_ENGINE,
+    r'\d+(\s+[A-Za-z]+){1,6},?\s*[A-Za-z ]+,?\s*[A-Z]{2}\s*\d{5}(-\d{4})?\b'
+)
+_ADDR_WINDOW = 200
+
+_VERIFICATION_SOURCES = {
+    "DOB_verification": r'\b(?:date\s+of\s+birth|dob|birthday).{0,30}(?:verify|confirm|check)',
+    "Address_verification": r'\b(?:address|residence).{0,30}(?:verify|confirm|check)',
+    "SSN_verification": r'\b(?:ssn|social security|social).{0,30}(?:verify|confirm|check)'
+}
+
+_VERIFICATION_PATTERNS = {
+    key: _compile(re, source) for key, source in _VERIFICATION_SOURCES.items()
+}
+
+# Every sensitive pattern requires at least one digit, so a digit scan
+# is a complete necessary condition for the full alternation to match.
+# Most agent turns (greetings, pleasantries) have none and skip the
+# heavy scan entirely.
+_SENSITIVE_HINT = re.compile(r"\d", re.ASCII)
+
+# Literal cues that must appear for the matching pattern to fire at all.
+# str.__contains__ uses a Boyer-Moore-style scan that is far cheaper
+# than a regex dispatch on a miss, so check these before searching. Each
+# literal must be genuinely implied by its pattern: 'birth' rather than
+# 'date of birth', since date\s+of\s+birth admits any whitespace run.
+_VERIFICATION_PREFILTER = {
+    "DOB_verification": ("birth", "dob"),
+    "Address_verification": ("address", "residence"),
+    "SSN_verification": ("ssn", "social")
+}
+
+
+# On-disk cache for compiled pattern artifacts, keyed by a SHA-256 over
+# the versioned pattern sources. Near-free for stdlib re, but it gates
+# engines with real compile cost (a serialized Hyperscan database takes
+# seconds to build and milliseconds to load).
+_PATTERN_CACHE_VERSION = 2
+_PATTERN_CACHE_DIR = Path.home() / ".cache" / "callanalyzer"
+
+
+def _pattern_cache_key(sources):
+    """SHA-256 over the cache version and sorted pattern sources, so any
+    pattern edit or format bump invalidates stale cache files."""
+    digest = hashlib.sha256()
+    digest.update(_PATTERN_CACHE_VERSION.to_bytes(4, "little"))
+    for label, source in sorted(sources.items()):
+        digest.update(label.encode())
+        digest.update(source.encode())
+    return digest.hexdigest()
+
+
+def _pattern_cache_load(key):
+    """Return the cached bytes for key, or None when absent/unreadable."""
+    try:
+        return (_PATTERN_CACHE_DIR / f"regex-{key}.bin").read_bytes()
+    except OSError:
+        return None
+
+
+def _pattern_cache_store(key, data):
+    """Best-effort atomic write of cache bytes; failures are ignored."""
+    path = _PATTERN_CACHE_DIR / f"regex-{key}.bin"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        _PATTERN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _build_combined_pattern(sources, engine):
+    """Fuse the per-label patterns into one named-group alternation so each
+    utterance is scanned in a single pass instead of one pass per label.
+    Group names cannot contain spaces, so also return a mapping back to
+    the original labels. Compiled stdlib patterns are persisted through
+    the on-disk cache; RE2 objects are not picklable, so that path always
+    compiles fresh."""
+    group_labels = {}
+    alternatives = []
+    for label, source in sources.items():
+        group = label.replace(" ", "_")
+        group_labels[group] = label
+        alternatives.append(f"(?P<{group}>{source})")
+    combined_source = "|".join(alternatives)
+
+    if engine is re:
+        key = _pattern_cache_key(sources)
+        cached = _pattern_cache_load(key)
+        if cached is not None:
+            try:
+                return pickle.loads(cached), group_labels
+            except Exception:
+                pass  # stale or corrupt cache entry; recompile below
+        compiled = _compile(engine, combined_source)
+        _pattern_cache_store(key, pickle.dumps(compiled))
+        return compiled, group_labels
+
+    return _compile(engine, combined_source), group_labels
+
+
+def _build_profanity_automaton(words):
+    """Build the Aho-Corasick automaton for the profanity list, or None
+    when pyahocorasick is not installed."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_hyperscan_db(sources):
+    """Compile the sensitive patterns into one Hyperscan database so a
+    single SIMD scan reports which labels hit. Hyperscan has no capture
+    groups and reports every match end, so the database is used as a
+    dispatcher (HS_FLAG_SINGLEMATCH: one report per pattern) and the
+    per-label patterns extract the actual spans afterwards. The compiled
+    database is seconds to build and milliseconds to deserialize, so it
+    goes through the on-disk pattern cache. Returns None when hyperscan
+    is unavailable or rejects a pattern."""
+    if hyperscan is None:
+        return None
+
+    key = "hs-" + _pattern_cache_key(sources)
+    cached = _pattern_cache_load(key)
+    if cached is not None:
+        try:
+            db = hyperscan.loadb(cached, hyperscan.HS_MODE_BLOCK)
+            db.scratch = hyperscan.Scratch(db)
+            return db
+        except Exception:
+            pass  # stale or corrupt cache entry; compile below
+
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[source.encode() for source in sources.values()],
+            ids=list(range(len(sources))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(sources)
+        )
+    except Exception:
+        return None
+    _pattern_cache_store(key, hyperscan.dumpb(db))
+    return db
+
+
+_COMBINED_SENSITIVE, _GROUP_LABELS = _build_combined_pattern(_SENSITIVE_SOURCES, _PATTERN_ENGINE)
+_COMBINED_VERIFICATION, _ = _build_combined_pattern(_VERIFICATION_SOURCES, re)
+_PROFANITY_AUTOMATON = _build_profanity_automaton(_PROFANITY_LIST)
+_SENSITIVE_HSDB = _build_hyperscan_db(_SENSITIVE_SOURCES)
+_SENSITIVE_LABELS = list(_SENSITIVE_SOURCES)
+
+
+def _silence_overtalk_kernel(stimes, etimes):
+    """Scalar sweep-line over float64 start/end arrays returning
+    (silence, overtalk); written loop-style so Numba can compile it.
+    The overtalk sweep merges the two sorted arrays with a pair of
+    pointers instead of sorting a combined 2N event list."""
+    n = stimes.shape[0]
+    order = np.argsort(stimes, kind='mergesort')
+    s_sorted = stimes[order]
+    silence = 0.0
+    last_end = s_sorted[0]
+    for i in range(n):
+        j = order[i]
+        if stimes[j] > last_end:
+            silence += stimes[j] - last_end
+        if etimes[j] > last_end:
+            last_end = etimes[j]
+
+    e_sorted = np.sort(etimes)
+    overtalk = 0.0
+    concurrent = 0
+    prev = s_sorted[0]
+    i = 0
+    j = 0
+    while j < n:
+        if i < n and s_sorted[i] <= e_sorted[j]:
+            t = s_sorted[i]
+            if concurrent > 1:
+                overtalk += t - prev
+            concurrent += 1
+            i += 1
+        else:
+            t = e_sorted[j]
+            if concurrent > 1:
+                overtalk += t - prev
+            concurrent -= 1
+            j += 1
+        prev = t
+    return silence, overtalk
+
+
+if njit is not None:
+    # The explicit signature forces compilation at import and cache=True
+    # persists the machine code to disk, so the JIT cost is paid once.
+    _silence_overtalk_kernel = njit(
+        "UniTuple(float64, 2)(float64[:], float64[:])", cache=True
+    )(_silence_overtalk_kernel)
+
 
 class CallAnalyzer:
 
     def __init__(self):
-        self.profanity_list = {
-            "damn", "hell", "shit", "fuck", "ass", "bitch", "crap", "piss",
-            "dick", "bastard", "asshole", "bullshit", "cunt", "goddamn"
-        }
-
-        self.sensitive_patterns = {
-            "SSN": re.compile(r'\b\d{3}[-]?\d{2}[-]?\d{4}\b'),
-            "DOB": re.compile(r'\b(0?[1-9]|1[0-2])[\/\-](0?[1-9]|[12][0-9]|3[01])[\/\-](19|20)?\d{2}\b'),
-            "Account": re.compile(r'\baccount\s?(?:number|#|no)?\s?[:#]?\s?\d{4,}\b'),
-            "Balance": re.compile(r'\b(?:balance|amount|owe|debt).{0,20}\$?\s?\d+(?:\.\d{2})?\b'),
-            "Address": re.compile(r'\b\d+\s+([A-Za-z]+\s?)+,?\s*([A-Za-z]+\s?)+,?\s*[A-Z]{2}\s*\d{5}(-\d{4})?\b'),
-            "Credit Card": re.compile(r'\b(?:\d{4}[ -]?){3}\d{4}\b'),
-            "Phone": re.compile(r'\b(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b')
-        }
-
-        self.verification_patterns = {
-            "DOB_verification": re.compile(r'\b(?:date\s+of\s+birth|dob|birthday).{0,30}(?:verify|confirm|check)'),
-            "Address_verification": re.compile(r'\b(?:address|residence).{0,30}(?:verify|confirm|check)'),
-            "SSN_verification": re.compile(r'\b(?:ssn|social security|social).{0,30}(?:verify|confirm|check)')
-        }
+        # Everything regex-related is compiled once at module import;
+        # instances just alias the shared read-only tables, so building
+        # one analyzer per worker or per file costs nothing.
+        self.profanity_list = _PROFANITY_LIST
+        self.sensitive_patterns = _SENSITIVE_PATTERNS
+        self.verification_patterns = _VERIFICATION_PATTERNS
+        self._punct_table = _PUNCT_TABLE
+        self._ac = _PROFANITY_AUTOMATON
+        self._combined_sensitive = _COMBINED_SENSITIVE
+        self._group_labels = _GROUP_LABELS
+        self._hs_db = _SENSITIVE_HSDB
 
         self.results = {}
 
     def detect_profanity(self, text):
-        """Detect profanity in text"""
-        text = str(text).lower()
-        words = re.findall(r'\b\w+\b', text)
-        return [word for word in words if word in self.profanity_list]
+        """Detect profanity in text; expects already-lowercased text"""
+        if self._ac is not None:
+            return [word for end, word in self._ac.iter(text)
+                    if self._word_boundary_ok(text, end, word)]
+        tokens = text.translate(self._punct_table).split()
+        return [word for word in tokens if word in self.profanity_list]
+
+    @staticmethod
+    def _word_boundary_ok(text, end, word):
+        """Check that an automaton hit is a whole word, not a substring"""
+        start = end - len(word) + 1
+        if start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+            return False
+        nxt = end + 1
+        return nxt >= len(text) or not (text[nxt].isalnum() or text[nxt] == "_")
 
     def detect_sensitive_info(self, text):
-        """Detect sensitive information in text"""
-        text = str(text).lower()
-        violations = {label: pattern.findall(text) for label, pattern in self.sensitive_patterns.items() if pattern.search(text)}
-        return violations if violations else None
+        """Detect sensitive information in text; expects already-lowercased text"""
+        if _SENSITIVE_HINT.search(text) is None:
+            return None
+
+        violations = defaultdict(list)
+
+        if self._hs_db is not None:
+            # One SIMD scan says which labels hit; only those labels run
+            # their own pattern to extract the matched spans.
+            hit_ids = set()
+            self._hs_db.scan(
+                text.encode(),
+                match_event_handler=lambda pid, start, end, flags, ctx: hit_ids.add(pid)
+            )
+            for pid in sorted(hit_ids):
+                label = _SENSITIVE_LABELS[pid]
+                for match in self.sensitive_patterns[label].finditer(text):
+                    violations[label].append(match.group())
+        else:
+            # The fused pattern only gates, same as in detect_verification:
+            # finditer yields non-overlapping matches, so a label whose hit
+            # overlaps an earlier alternative's (e.g. an SSN swallowed by
+            # Balance's .{0,20}) would be silently dropped. When the gate
+            # fires, every label extracts its own spans.
+            if self._combined_sensitive.search(text) is not None:
+                for label, pattern in self.sensitive_patterns.items():
+                    for match in pattern.finditer(text):
+                        violations[label].append(match.group())
+
+        self._detect_address(text, violations)
+        return dict(violations) if violations else None
+
+    @staticmethod
+    def _detect_address(text, violations):
+        """Two-phase address match: find candidate offsets with the cheap
+        anchor, then validate a bounded window at each candidate"""
+        for anchor in _ADDR_ANCHOR.finditer(text):
+            window = text[anchor.start():anchor.start() + _ADDR_WINDOW]
+            match = _ADDR_VALIDATOR.match(window)
+            if match:
+                violations["Address"].append(match.group())
 
     def detect_verification(self, conversation):
         """Check if verification was performed before sensitive info was shared"""
         verification_done = {key: False for key in self.verification_patterns.keys()}
-        sensitive_info_shared = False
 
         for entry in conversation:
-            if entry["speaker"].lower() == "agent":
-                text = entry["text"].lower()
-
-                for key, pattern in self.verification_patterns.items():
-                    if pattern.search(text):
-                        verification_done[key] = True  # Mark verification done
+            if entry["speaker"].lower() != "agent":
+                continue
+            text = entry["text"].lower()
+
+            # One fused scan decides whether this turn mentions any
+            # verification phrase at all; only then run the per-key
+            # patterns (the fused match alone cannot report overlapping
+            # phrases for two different keys in the same turn).
+            if _COMBINED_VERIFICATION.search(text) is None:
+                continue
+
+            for key, pattern in self.verification_patterns.items():
+                if verification_done[key]:
+                    continue
+                literals = _VERIFICATION_PREFILTER.get(key)
+                if literals and not any(lit in text for lit in literals):
+                    continue
+                if pattern.search(text):
+                    verification_done[key] = True  # Mark verification done
+
+            # Nothing left to find once every key has been confirmed.
+            if all(verification_done.values()):
+                return verification_done
 
         return verification_done  # Return full verification state
 
-    def analyze_silence_overtalk(self, conversation):
+    def analyze_silence_overtalk(self, stimes, etimes):
 
-        """Calculate silence and overtalk metrics using a sweep-line algorithm"""
-        if not conversation:
+        """Calculate silence and overtalk metrics from start/end time arrays"""
+        n = len(stimes)
+        if n == 0:
             return {"silence_pct": 0, "overtalk_pct": 0}
 
-        stimes = [entry["stime"] for entry in conversation]
-        etimes = [entry["etime"] for entry in conversation]
-        first_time, last_time = min(stimes), max(etimes)
-        total_duration = last_time - first_time
+        total_duration = float(etimes.max() - stimes.min())
 
         if total_duration <= 0:
             return {"silence_pct": 0, "overtalk_pct": 0}
 
-        silence_duration = 0
-        last_end = first_time
-
-        for entry in sorted(conversation, key=lambda x: x["stime"]):
-            if entry["stime"] > last_end:
-                silence_duration += (entry["stime"] - last_end)
-            last_end = max(last_end, entry["etime"])
-
-        events = []
-        for entry in conversation:
-            events.append((entry["stime"], 1))  # Start of speech
-            events.append((entry["etime"], -1))  # End of speech
-
-        events.sort()
-        concurrent_speakers, overtalk_duration = 0, 0
-        prev_time = first_time
+        # A single turn cannot contain a gap or an overlap; skip the
+        # sweep and its allocations entirely.
+        if n == 1:
+            return {
+                "total_call_duration": total_duration,
+                "silence_duration": 0.0,
+                "silence_pct": 0.0,
+                "overtalk_duration": 0.0,
+                "overtalk_pct": 0.0
+            }
 
-        for time, change in events: 
-            if concurrent_speakers > 1:
-                overtalk_duration += (time - prev_time)
-            concurrent_speakers += change
-            prev_time = time
+        if njit is not None:
+            silence_duration, overtalk_duration = _silence_overtalk_kernel(stimes, etimes)
+        else:
+            # Silence: in start-time order, a turn contributes the gap between
+            # its start and the running maximum end time of all earlier turns.
+            order = np.argsort(stimes, kind="stable")
+            running_max_end = np.maximum.accumulate(etimes[order])
+            gaps = stimes[order][1:] - running_max_end[:-1]
+            silence_duration = float(np.clip(gaps, 0, None).sum())
+
+            # Overtalk: sweep start/end events and sum the intervals during
+            # which more than one speaker is active.
+            times = np.concatenate([stimes, etimes])
+            deltas = np.concatenate([np.ones(n), -np.ones(n)])
+            idx = np.argsort(times, kind="stable")
+            sweep_times = times[idx]
+            concurrent = np.cumsum(deltas[idx])
+            durations = np.diff(sweep_times)
+            overtalk_duration = float(durations[concurrent[:-1] > 1].sum())
 
         return {
             "total_call_duration": total_duration,
@@ -107,10 +451,22 @@ class CallAnalyzer:
 
     def analyze_call(self, conversation, call_id):
         """Analyze a single call"""
-    
-        start_time = min(entry["stime"] for entry in conversation)
-        end_time = max(entry["etime"] for entry in conversation)
-        total_duration = end_time - start_time
+
+        # One pass turns the list of entry dicts into per-field arrays;
+        # everything downstream (duration, metrics, per-turn scans) reads
+        # these instead of re-traversing the conversation.
+        n = len(conversation)
+        stimes = np.empty(n, np.float64)
+        etimes = np.empty(n, np.float64)
+        speakers = []
+        texts = []
+        for i, entry in enumerate(conversation):
+            stimes[i] = entry["stime"]
+            etimes[i] = entry["etime"]
+            speakers.append(entry["speaker"].lower())
+            texts.append(entry["text"])
+
+        total_duration = float(etimes.max() - stimes.min())
 
         verification_state = self.detect_verification(conversation)
 
@@ -122,21 +478,33 @@ class CallAnalyzer:
                 "sensitive_info_shared": False,
                 "violations": []
             },
-            "call_metrics": self.analyze_silence_overtalk(conversation),
+            "call_metrics": self.analyze_silence_overtalk(stimes, etimes),
             "total_duration": total_duration  # Show call duration correctly
         }
 
-        for entry in conversation:
-            speaker = entry["speaker"].lower()
-            text = entry["text"]
+        # Scripted calls repeat utterances verbatim (greetings, hold
+        # markers); memoize detector results per call so each distinct
+        # string is only scanned once.
+        prof_cache = {}
+        sens_cache = {}
 
+        for speaker, text in zip(speakers, texts):
             if isinstance(text, str):
-                profanity = self.detect_profanity(text)
+                # Both detectors work on lowercased text; copy it once
+                # here instead of once per detector.
+                lowered = text.lower()
+                if lowered in prof_cache:
+                    profanity = prof_cache[lowered]
+                else:
+                    profanity = prof_cache[lowered] = self.detect_profanity(lowered)
                 if profanity:
                     result["profanity"][speaker].append({"text": text, "profanity": profanity})
 
                 if speaker == "agent":
-                    sensitive = self.detect_sensitive_info(text)
+                    if lowered in sens_cache:
+                        sensitive = sens_cache[lowered]
+                    else:
+                        sensitive = sens_cache[lowered] = self.detect_sensitive_info(lowered)
                     if sensitive:
                         result["privacy_compliance"]["sensitive_info_shared"] = True
 
@@ -153,38 +521,60 @@ class CallAnalyzer:
     def analyze_calls_from_json_directory(self, directory):
         """Analyze all JSON call records in a directory"""
         results = {}
-        directory = Path(directory)
-        json_files = directory.glob("*.json")
+        json_files = sorted(Path(directory).glob("*.json"))
 
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r') as file:
-                    conversation = json.load(file)
-                call_id = json_file.stem
-                results[call_id] = self.analyze_call(conversation, call_id)
-            except json.JSONDecodeError:
-                print(f"Skipping corrupted file: {json_file}")
+        # Every call file is independent and the analysis is CPU-bound in
+        # the regex engine, so fan the files out across cores. chunksize
+        # amortizes the pickling round-trip per task.
+        with ProcessPoolExecutor() as executor:
+            for call_id, result in executor.map(_analyze_one, json_files, chunksize=16):
+                if result is not None:
+                    results[call_id] = result
 
         self.results = results
         return results
 
     def export_results_to_csv(self, output_file):
         """Export results to CSV"""
-        df = pd.DataFrame([
-            {
-                "call_id": call_id,
-                "agent_profanity": "Yes" if result["profanity"]["agent"] else "No",
-                "customer_profanity": "Yes" if result["profanity"]["customer"] else "No",
-                "compliance_violation": "Yes" if not result["privacy_compliance"]["verification_done"] else "No",
-                "silence_pct": result["call_metrics"]["silence_pct"],
-                "overtalk_pct": result["call_metrics"]["overtalk_pct"]
-            }
-            for call_id, result in self.results.items()
-        ])
-        df.to_csv(output_file, index=False)
+        # Stream the rows straight to disk; nothing here needs a
+        # DataFrame, and this path holds only one row in memory at a time.
+        with open(output_file, "w", newline="", buffering=1 << 20) as f:
+            # \n to stay byte-identical with the old pandas export; the
+            # excel dialect would otherwise emit \r\n.
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow([
+                "call_id", "agent_profanity", "customer_profanity",
+                "compliance_violation", "silence_pct", "overtalk_pct"
+            ])
+            for call_id, result in self.results.items():
+                writer.writerow([
+                    call_id,
+                    "Yes" if result["profanity"]["agent"] else "No",
+                    "Yes" if result["profanity"]["customer"] else "No",
+                    "Yes" if not result["privacy_compliance"]["verification_done"] else "No",
+                    result["call_metrics"]["silence_pct"],
+                    result["call_metrics"]["overtalk_pct"]
+                ])
         return f"Results exported to {output_file}"
 
 
+def _analyze_one(json_file):
+    """Load and analyze one call file; module-level so it pickles for
+    the process pool. Returns (call_id, result), result None on bad JSON."""
+    json_file = Path(json_file)
+    call_id = json_file.stem
+    try:
+        # orjson wants bytes, so read in binary mode; the raw read also
+        # works for the stdlib fallback.
+        with open(json_file, 'rb') as file:
+            raw = file.read()
+        conversation = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:  # covers both orjson and stdlib JSONDecodeError
+        print(f"Skipping corrupted file: {json_file}")
+        return call_id, None
+    return call_id, CallAnalyzer().analyze_call(conversation, call_id)
+
+
 def main():
     analyzer = CallAnalyzer()
 